@@ -1,7 +1,5 @@
 import asyncio
 import logging
-import threading
-from time import sleep
 
 import schedule
 
@@ -20,21 +18,15 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-# Global event loop for async operations
-event_loop = None
+# Running sync task of each folder, also keeps a reference so tasks are not garbage collected
+running_syncs: dict[str, asyncio.Task] = {}
 
 
-def start_event_loop(loop):
-    """Start the event loop in a separate thread."""
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
-
-
-def start_sync_folder(folder: FolderParameter, is_second_attempt: bool = False):
+async def start_sync_folder(folder: FolderParameter, is_second_attempt: bool = False):
     sync_service = SyncService(folder)
 
     try:
-        sync_service.sync_folder()
+        await sync_service.sync_folder()
     except AuthentificationRequiredException:
         if is_second_attempt:
             logging.error(
@@ -45,57 +37,72 @@ def start_sync_folder(folder: FolderParameter, is_second_attempt: bool = False):
                 f"Failed to connect to cloud provider for folder: {folder.name}, send a notification to reconnect"
             )
 
-            # Use asyncio.run_coroutine_threadsafe to run the async notification
-            asyncio.run_coroutine_threadsafe(
-                NotificationService.send_reconnection_notification(
-                    folder.cloud_provider,
-                    lambda: reconnect_and_sync(folder)
-                ),
-                event_loop
+            # The button callback may be called from another thread, start the reconnection on this loop
+            loop = asyncio.get_running_loop()
+            await NotificationService.send_reconnection_notification(
+                folder.cloud_provider,
+                lambda: loop.call_soon_threadsafe(schedule_reconnection, folder)
             )
     except Exception as e:
         logging.error(f"An unexpected error occurred during sync for folder: {folder.name}. Error: {str(e)}")
-        asyncio.run_coroutine_threadsafe(
-            NotificationService.send_error_notification(f"Error syncing folder '{folder.name}'. Check logs for details."),
-            event_loop
-        )
+        await NotificationService.send_error_notification(f"Error syncing folder '{folder.name}'. Check logs for details.")
+
+
+async def reconnect_and_sync(folder: FolderParameter, previous_sync: asyncio.Task | None = None):
+    # Reconnect once the running sync of the folder, if any, is finished
+    if previous_sync is not None:
+        await asyncio.wait([previous_sync])
 
-def reconnect_and_sync(folder: FolderParameter):
     dao = get_clouddao_from_cloud_enum(folder.cloud_provider)
-    dao.init_connection(can_open_connection_page=True)
 
-    start_sync_folder(folder, is_second_attempt=True)
+    try:
+        await dao.init_connection(can_open_connection_page=True)
+    except Exception as e:
+        logging.error(f"Reconnection to cloud provider failed for folder: {folder.name}. Error: {str(e)}")
+        await NotificationService.send_error_notification(f"Reconnection failed for folder '{folder.name}'. Check logs for details.")
+        return
+
+    await start_sync_folder(folder, is_second_attempt=True)
+
 
+def schedule_sync_folder(folder: FolderParameter):
+    """Start the sync of a folder in the background, unless its previous sync is still running."""
+    running_sync = running_syncs.get(folder.name)
+    if running_sync is not None and not running_sync.done():
+        logging.warning(f"Previous sync of folder: '{folder.name}' is still running, skipping this run")
+        return
 
-def main():
-    global event_loop
+    running_syncs[folder.name] = asyncio.create_task(start_sync_folder(folder))
 
-    # Create and start the event loop in a separate thread
-    event_loop = asyncio.new_event_loop()
-    loop_thread = threading.Thread(target=start_event_loop, args=(event_loop,), daemon=True)
-    loop_thread.start()
 
+def schedule_reconnection(folder: FolderParameter):
+    """Start the reconnection of a folder in the background, after its running sync if there is one."""
+    previous_sync = running_syncs.get(folder.name)
+    running_syncs[folder.name] = asyncio.create_task(reconnect_and_sync(folder, previous_sync))
+
+
+async def main():
     folders_config = FoldersConfig()
 
     # Initialize connections for each folder's cloud provider
     # to check if credentials are valid
     for folder_config in folders_config.folders_parameters:
         # first run
-        start_sync_folder(folder_config)
+        schedule_sync_folder(folder_config)
 
         # schedule the sync job
         schedule.every(folder_config.sync_interval).minutes.do(
-            start_sync_folder, folder=folder_config
+            schedule_sync_folder, folder=folder_config
         )
 
-    try:
-        while True:
-            schedule.run_pending()
-            sleep(1)
-    except KeyboardInterrupt:
-        logging.info("Shutting down...")
-        event_loop.call_soon_threadsafe(event_loop.stop)
+    # All folders share this event loop, scheduled jobs only start tasks on it
+    while True:
+        schedule.run_pending()
+        await asyncio.sleep(1)
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logging.info("Shutting down...")
@@ -4,13 +4,13 @@ from pathlib import Path
 
 class CloudDAO(ABC):
 
-    def upload_files(self, remote_folder: str, files: list[Path], local_base_path: Path = None):
+    async def upload_files(self, remote_folder: str, files: list[Path], local_base_path: Path = None):
         pass
 
-    def download_files(self):
+    async def download_files(self):
         pass
 
-    def init_connection(self, can_open_connection_page: bool = False):
+    async def init_connection(self, can_open_connection_page: bool = False):
         """Establishes a connection to the cloud service and save credentials locally.
 
         Args:
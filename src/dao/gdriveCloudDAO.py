@@ -1,12 +1,18 @@
+import asyncio
 import logging
 import os.path
+import threading
 from pathlib import Path
+from typing import Callable
 
 import googleapiclient
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import Resource, build
+from googleapiclient.http import HttpRequest
 from httplib2 import ServerNotFoundError
 
 from src import utils
@@ -22,105 +28,181 @@ SCOPES = ["https://www.googleapis.com/auth/drive.file"]
 TOKEN_PATH = "credentials/token.json"
 CREDENTIALS_PATH = "credentials/gdrive_credentials.json"
 
+# Maximum number of Drive API requests in flight at the same time, shared by every folder
+MAX_CONCURRENT_REQUESTS = 10
+
 
 class GDriveCloudDAO(CloudDAO):
     _instance = None
     gdrive_service: Resource
+    credentials: Credentials
+
+    # State shared by every instance, the asyncio primitives are created on the running loop by _init_shared_state
+    _shared_loop: asyncio.AbstractEventLoop | None = None
+    _request_semaphore: asyncio.Semaphore
+    _credentials_lock: asyncio.Lock
+    _folder_locks: dict[str, asyncio.Lock]  # One lock per folder path: {folder_path: lock}
+    _folder_cache: dict[str, str] = {}  # Cache for folder IDs: {folder_path: folder_id}
+    _active_upload_sessions = 0
+    _shared_credentials: Credentials | None = None
+    _thread_local = threading.local()  # AuthorizedHttp of each worker thread
+
+    async def upload_files(self, remote_folder: str, files: list[Path], local_base_path: Path = None):
+        # Clear cache at the beginning of each upload session, unless another folder is still using it
+        if GDriveCloudDAO._active_upload_sessions == 0:
+            self._folder_cache.clear()
+
+        GDriveCloudDAO._active_upload_sessions += 1
+        try:
+            await self._upload_files(remote_folder, files, local_base_path)
+        finally:
+            GDriveCloudDAO._active_upload_sessions -= 1
 
-    def __init__(self):
-        super().__init__()
-        self._folder_cache = {}  # Cache for folder IDs: {folder_path: folder_id}
-
-    def upload_files(self, remote_folder: str, files: list[Path], local_base_path: Path = None):
-        # Clear cache at the beginning of each upload session
-        self._folder_cache.clear()
-
+    async def _upload_files(self, remote_folder: str, files: list[Path], local_base_path: Path = None):
         # Get or create the folder ID from the remote_path
         try:
-            folder_id = self._get_or_create_folder(remote_folder)
+            folder_id = await self._get_or_create_folder(remote_folder)
 
+            # Resolve target folders one by one so concurrent uploads never create the same folder twice
+            targets = []
             for file in files:
-                target_folder_id = self._determine_target_folder(file, remote_folder, folder_id, local_base_path)
-                self._upload_single_file(file, target_folder_id)
+                target_folder_id = await self._determine_target_folder(file, remote_folder, folder_id, local_base_path)
+                targets.append((file, target_folder_id))
+
+            # If an upload fails the others are cancelled, and the group only exits once they are all done
+            async with asyncio.TaskGroup() as task_group:
+                for file, target_folder_id in targets:
+                    task_group.create_task(self._upload_single_file(file, target_folder_id))
         except ServerNotFoundError:
             raise NoInternet("Don't have access to internet or the cloud provider api is down")
+        except ExceptionGroup as group:
+            if group.subgroup(ServerNotFoundError) is not None:
+                raise NoInternet("Don't have access to internet or the cloud provider api is down")
+
+            # Raise the first failure instead of the group so its real cause is logged, and log the others
+            for error in group.exceptions[1:]:
+                logging.error(f"Another upload failed during the same sync: {str(error)}", exc_info=error)
+            raise group.exceptions[0]
+
+    @classmethod
+    def _init_shared_state(cls):
+        """Create the asyncio primitives shared by every instance, once per event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._shared_loop is not loop:
+            cls._shared_loop = loop
+            cls._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            cls._credentials_lock = asyncio.Lock()
+            cls._folder_locks = {}
+            cls._folder_cache.clear()
+
+    def _get_thread_http(self) -> AuthorizedHttp:
+        """
+        Return the AuthorizedHttp of the current worker thread.
+        httplib2 is not thread-safe, so each thread keeps its own connections and reuses them between requests.
+        """
+        thread_http = getattr(self._thread_local, "http", None)
+        if thread_http is None or thread_http.credentials is not self.credentials:
+            thread_http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = thread_http
+        return thread_http
 
+    async def _execute(self, make_request: Callable[[], HttpRequest]) -> dict:
+        """
+        Build and execute a Drive API request in a worker thread.
+        The number of requests in flight is bounded by the shared semaphore.
+        """
+        async with self._request_semaphore:
+            return await self._to_thread(lambda: make_request().execute(http=self._get_thread_http()))
 
-    def _determine_target_folder(self, file: Path, remote_folder: str, default_folder_id: str,
-                                 local_base_path: Path = None) -> str:
+    @staticmethod
+    async def _to_thread(function: Callable, *args):
+        """
+        Run a function in a worker thread like asyncio.to_thread.
+        If cancelled, waits for the thread to finish before propagating the cancellation,
+        since the thread cannot be interrupted and must not outlive the sync.
+        """
+        work = asyncio.ensure_future(asyncio.to_thread(function, *args))
+        try:
+            return await asyncio.shield(work)
+        except asyncio.CancelledError:
+            await asyncio.wait([work])
+            if not work.cancelled():
+                work.exception()  # mark the exception as retrieved, the cancellation wins
+            raise
+
+    async def _determine_target_folder(self, file: Path, remote_folder: str, default_folder_id: str,
+                                       local_base_path: Path = None) -> str:
         """Determine the target folder ID for a file based on its local path structure."""
         if local_base_path and file.is_relative_to(local_base_path):
             relative_path = file.relative_to(local_base_path)
             if relative_path.parent != Path("."):
                 # File is in a subdirectory, create the full path
                 target_folder_path = f"{remote_folder.rstrip('/')}/{relative_path.parent.as_posix()}"
-                return self._get_or_create_folder(target_folder_path)
+                return await self._get_or_create_folder(target_folder_path)
 
         return default_folder_id
 
-    def _upload_single_file(self, file: Path, target_folder_id: str):
+    async def _upload_single_file(self, file: Path, target_folder_id: str):
         """Upload or update a single file to Google Drive."""
         name = os.path.basename(str(file))
         q_name = name.replace("'", "\\'")  # Escape single quotes for the Drive query
 
         # Check if file exists and needs update
-        existing_file_id = self._find_existing_file(q_name, target_folder_id)
+        existing_file_id = await self._find_existing_file(q_name, target_folder_id)
 
         if existing_file_id:
-            self._update_file_if_changed(file, name, existing_file_id)
+            await self._update_file_if_changed(file, name, existing_file_id)
         else:
-            self._create_new_file(file, name, target_folder_id)
+            await self._create_new_file(file, name, target_folder_id)
 
-    def _find_existing_file(self, q_name: str, target_folder_id: str) -> str | None:
+    async def _find_existing_file(self, q_name: str, target_folder_id: str) -> str | None:
         """Search for an existing file in the target folder. Returns file ID if found, None otherwise."""
         query = f"name = '{q_name}' and '{target_folder_id}' in parents and trashed = false"
-        results = self.gdrive_service.files().list(
+        results = await self._execute(lambda: self.gdrive_service.files().list(
             q=query,
             spaces="drive",
             fields="files(id, name, md5Checksum)"
-        ).execute()
+        ))
 
         items = results.get("files", [])
         return items[0]["id"] if items else None
 
-    def _update_file_if_changed(self, file: Path, name: str, existing_file_id: str):
+    async def _update_file_if_changed(self, file: Path, name: str, existing_file_id: str):
         """Update a file only if its content has changed (based on MD5 hash)."""
-        local_md5 = utils.calculate_md5(file)
+        local_md5 = await self._to_thread(utils.calculate_md5, file)
 
         # Get remote file metadata
-        remote_file = self.gdrive_service.files().get(
+        remote_file = await self._execute(lambda: self.gdrive_service.files().get(
             fileId=existing_file_id,
             fields="md5Checksum"
-        ).execute()
+        ))
 
         remote_md5 = remote_file.get("md5Checksum")
 
         if remote_md5 == local_md5:
             logging.debug(f"File '{name}' is already up to date, skipping upload")
         else:
-            media = googleapiclient.http.MediaFileUpload(str(file), resumable=True)
-            updated_file = self.gdrive_service.files().update(
+            updated_file = await self._execute(lambda: self.gdrive_service.files().update(
                 fileId=existing_file_id,
-                media_body=media,
+                media_body=googleapiclient.http.MediaFileUpload(str(file), resumable=True),
                 fields="id"
-            ).execute()
+            ))
             logging.debug(f"File '{name}' has been updated with ID: {updated_file['id']}")
 
-    def _create_new_file(self, file: Path, name: str, target_folder_id: str):
+    async def _create_new_file(self, file: Path, name: str, target_folder_id: str):
         """Create a new file in Google Drive."""
-        media = googleapiclient.http.MediaFileUpload(str(file), resumable=True)
         file_metadata = {
             "name": name,
             "parents": [target_folder_id]
         }
-        uploaded_file = self.gdrive_service.files().create(
+        uploaded_file = await self._execute(lambda: self.gdrive_service.files().create(
             body=file_metadata,
-            media_body=media,
+            media_body=googleapiclient.http.MediaFileUpload(str(file), resumable=True),
             fields="id"
-        ).execute()
+        ))
         logging.debug(f"File '{name}' uploaded with ID: {uploaded_file['id']}")
 
-    def _get_or_create_folder(self, folder_path: str) -> str:
+    async def _get_or_create_folder(self, folder_path: str) -> str:
         """
         Get or create a folder in Google Drive from a path like "/images" or "/backup/photos".
         Returns the folder ID. Uses cache to avoid repeated lookups.
@@ -145,50 +227,71 @@ class GDriveCloudDAO(CloudDAO):
             # Build the path up to this point for caching
             current_path = "/" + "/".join(folder_names[:i + 1])
 
-            # Check if this intermediate path is already cached
-            if current_path in self._folder_cache:
-                parent_id = self._folder_cache[current_path]
-                continue
-
-            # Search for the folder
-            query = f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            results = self.gdrive_service.files().list(
-                q=query,
-                spaces="drive",
-                fields="files(id, name)"
-            ).execute()
-
-            items = results.get("files", [])
-
-            if items:
-                # Folder exists, use its ID
-                parent_id = items[0]["id"]
-                logging.debug(f"Found existing folder '{folder_name}' with ID: {parent_id}")
-            else:
-                # Folder doesn't exist, create it
-                folder_metadata = {
-                    "name": folder_name,
-                    "mimeType": "application/vnd.google-apps.folder",
-                    "parents": [parent_id]
-                }
-                folder = self.gdrive_service.files().create(
-                    body=folder_metadata,
-                    fields="id"
-                ).execute()
-                parent_id = folder["id"]
-                logging.debug(f"Created folder '{folder_name}' with ID: {parent_id}")
-
-            # Cache this path
-            self._folder_cache[current_path] = parent_id
+            # Folders sync concurrently and may share parents, resolve each path once to never create duplicates
+            async with self._folder_locks.setdefault(current_path, asyncio.Lock()):
+                # Check if this intermediate path is already cached
+                if current_path not in self._folder_cache:
+                    self._folder_cache[current_path] = await self._find_or_create_folder(folder_name, parent_id)
+
+            parent_id = self._folder_cache[current_path]
 
         # Cache the final full path
         self._folder_cache[folder_path] = parent_id
         return parent_id
 
-    def download_files(self):
+    async def _find_or_create_folder(self, folder_name: str, parent_id: str) -> str:
+        """Search for a folder by name in the parent folder, create it if it does not exist. Returns the folder ID."""
+        # Search for the folder
+        query = f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        results = await self._execute(lambda: self.gdrive_service.files().list(
+            q=query,
+            spaces="drive",
+            fields="files(id, name)"
+        ))
+
+        items = results.get("files", [])
+
+        if items:
+            # Folder exists, use its ID
+            folder_id = items[0]["id"]
+            logging.debug(f"Found existing folder '{folder_name}' with ID: {folder_id}")
+        else:
+            # Folder doesn't exist, create it
+            folder_metadata = {
+                "name": folder_name,
+                "mimeType": "application/vnd.google-apps.folder",
+                "parents": [parent_id]
+            }
+            folder = await self._execute(lambda: self.gdrive_service.files().create(
+                body=folder_metadata,
+                fields="id"
+            ))
+            folder_id = folder["id"]
+            logging.debug(f"Created folder '{folder_name}' with ID: {folder_id}")
+
+        return folder_id
+
+    async def download_files(self):
         raise NotImplemented()
 
-    def init_connection(self, can_open_connection_page: bool = False):
+    async def init_connection(self, can_open_connection_page: bool = False):
+        self._init_shared_state()
+
+        # Credentials are shared by every folder, load them one at a time so the token is
+        # refreshed, written and requested in the browser only once
+        async with self._credentials_lock:
+            shared_credentials = GDriveCloudDAO._shared_credentials
+            if shared_credentials is None or not shared_credentials.valid:
+                # Loading credentials may refresh the token or wait for the browser login indefinitely,
+                # run it on a daemon thread so it does not block the event loop nor the application shutdown
+                shared_credentials = await utils.run_in_daemon_thread(self._load_credentials, can_open_connection_page)
+                GDriveCloudDAO._shared_credentials = shared_credentials
+
+        self.credentials = shared_credentials
+        self.gdrive_service = await asyncio.to_thread(build, "drive", "v3", credentials=self.credentials)
+        logging.debug("GDrive: connection established")
+
+    def _load_credentials(self, can_open_connection_page: bool) -> Credentials:
         # code adapted from https://developers.google.com/workspace/drive/api/quickstart/python
 
         creds = None
@@ -224,5 +327,4 @@ class GDriveCloudDAO(CloudDAO):
             with open(utils.path(TOKEN_PATH), "w") as token:
                 token.write(creds.to_json())
 
-        self.gdrive_service = build("drive", "v3", credentials=creds)
-        logging.debug("GDrive: connection established")
+        return creds
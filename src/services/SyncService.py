@@ -1,3 +1,4 @@
+import asyncio
 import fnmatch
 import logging
 import os.path
@@ -16,15 +17,15 @@ class SyncService:
     def __init__(self, folder: FolderParameter):
         self.folder = folder
 
-    def sync_folder(self):
+    async def sync_folder(self):
         logging.info(f"Starting sync for folder: '{self.folder.name}'")
 
         # Initialize cloud connection
         dao = get_clouddao_from_cloud_enum(self.folder.cloud_provider)
-        dao.init_connection()
+        await dao.init_connection()
 
-        # Find files
-        files = self._get_files()
+        # Find files, walking the folder is blocking I/O so run it in a worker thread
+        files = await asyncio.to_thread(self._get_files)
         logging.debug(f"Found {len(files)} files to sync")
 
         if len(files) == 0:
@@ -33,14 +34,14 @@ class SyncService:
 
         # Compress files if needed
         if self.folder.compress:
-            files = [self._compress_files(files)]
+            files = [await asyncio.to_thread(self._compress_files, files)]
             local_base_path = None  # No structure preservation needed for zip
         else:
             local_base_path = Path(self.folder.local_path)
 
         # Upload files
         try:
-            dao.upload_files(self.folder.remote_path, files, local_base_path)
+            await dao.upload_files(self.folder.remote_path, files, local_base_path)
             logging.info(f"Sync {len(files)} files for folder: '{self.folder.name}'")
         except NoInternet as e:
             logging.error(f"failed to upload files to the cloud, error: {str(e)}")
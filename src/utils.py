@@ -1,6 +1,9 @@
+import asyncio
 import hashlib
 import os.path
+import threading
 from pathlib import Path
+from typing import Callable
 
 from config import ROOT_DIR
 
@@ -17,3 +20,37 @@ def calculate_md5(file_path: Path) -> str:
         for chunk in iter(lambda: f.read(4096), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
+
+
+async def run_in_daemon_thread(function: Callable, *args):
+    """
+    Run a blocking function in a daemon thread and await its result.
+    Unlike asyncio.to_thread, the event loop shutdown does not wait for the thread,
+    so a function that may block indefinitely does not prevent the application from exiting.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def set_outcome(result=None, error: BaseException = None):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run():
+        try:
+            result = function(*args)
+        except BaseException as e:
+            outcome = {"error": e}
+        else:
+            outcome = {"result": result}
+
+        try:
+            loop.call_soon_threadsafe(lambda: set_outcome(**outcome))
+        except RuntimeError:
+            pass  # the event loop is already closed, nobody is waiting for the result
+
+    threading.Thread(target=run, daemon=True).start()
+    return await future